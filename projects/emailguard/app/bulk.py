@@ -0,0 +1,236 @@
+"""
+EmailGuard Bulk Verification
+Incremental CSV/NDJSON readers, pipelined chunk verification and
+streaming NDJSON/CSV writers shared by the streaming endpoint and the CLI
+"""
+
+import asyncio
+import codecs
+import csv
+import io
+import json
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional
+
+from app.validator import EmailValidator, ValidationResult
+
+INPUT_FORMATS = ("csv", "ndjson")
+OUTPUT_FORMATS = ("ndjson", "csv")
+
+CSV_COLUMNS = ["email", "valid", "reason", "score", "suggestion", "syntax", "mx", "disposable", "role"]
+
+
+@dataclass
+class StreamProgress:
+    """Live counters for one bulk verification run"""
+    read: int = 0
+    processed: int = 0
+    valid: int = 0
+    invalid: int = 0
+    done: bool = False
+    started_at: float = field(default_factory=time.monotonic)
+
+    def snapshot(self) -> Dict[str, float]:
+        elapsed = time.monotonic() - self.started_at
+        return {
+            "read": self.read,
+            "processed": self.processed,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "done": self.done,
+            "elapsed_seconds": round(elapsed, 3),
+            "emails_per_second": round(self.processed / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+
+class StreamRegistry:
+    """Progress of running and recently finished streams, by id"""
+
+    def __init__(self, max_entries: int = 100):
+        self.max_entries = max_entries
+        self._streams: "OrderedDict[str, StreamProgress]" = OrderedDict()
+
+    def register(self) -> "tuple[str, StreamProgress]":
+        stream_id = uuid.uuid4().hex
+        progress = self._streams[stream_id] = StreamProgress()
+        while len(self._streams) > self.max_entries:
+            oldest = next(iter(self._streams))
+            if not self._streams[oldest].done:
+                break
+            del self._streams[oldest]
+        return stream_id, progress
+
+    def get(self, stream_id: str) -> Optional[StreamProgress]:
+        return self._streams.get(stream_id)
+
+
+async def iter_lines(chunks: AsyncIterable[bytes], encoding: str = "utf-8") -> AsyncIterator[str]:
+    """Split a byte stream into text lines without buffering the whole body"""
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        lines = pending.split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_addresses(lines: AsyncIterable[str], input_format: str) -> AsyncIterator[str]:
+    """
+    Extract email addresses from CSV or NDJSON lines.
+
+    CSV input uses the ``email`` column when the first row is a header
+    naming one, and the first column otherwise. NDJSON lines may be bare
+    JSON strings or objects with an ``email`` key. Blank and unparsable
+    lines are skipped.
+    """
+    column: Optional[int] = None
+    first = True
+    async for line in lines:
+        if not line.strip():
+            continue
+
+        if input_format == "ndjson":
+            try:
+                item = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(item, dict):
+                item = item.get("email")
+            if isinstance(item, str):
+                yield item
+            continue
+
+        row = next(csv.reader([line]), [])
+        if first:
+            first = False
+            header = [cell.strip().lower() for cell in row]
+            if "email" in header:
+                column = header.index("email")
+                continue
+        index = column or 0
+        if index < len(row):
+            yield row[index]
+
+
+async def _chunks(addresses: AsyncIterable[str], size: int, progress: StreamProgress) -> AsyncIterator[List[str]]:
+    chunk: List[str] = []
+    async for address in addresses:
+        chunk.append(address)
+        progress.read += 1
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def result_record(email: str, result: ValidationResult) -> dict:
+    """Build a response record matching the ``VerifyResponse`` schema"""
+    valid, reason, checks, score, suggestion = result
+    return {
+        "email": email,
+        "valid": valid,
+        "reason": reason.value,
+        "checks": checks.model_dump(),
+        "score": score,
+        "suggestion": suggestion,
+    }
+
+
+async def verify_stream(
+    validator: EmailValidator,
+    addresses: AsyncIterable[str],
+    progress: StreamProgress,
+    chunk_size: int = 500,
+    pipeline_depth: int = 2,
+) -> AsyncIterator[List[dict]]:
+    """
+    Verify an address stream in pipelined, domain-grouped chunks.
+
+    Yields one list of result records per input chunk, in input order. Up to ``pipeline_depth`` chunks are validated concurrently while the
+    oldest one is drained to the caller, so reading, DNS resolution and
+    output overlap. Nothing is read ahead of that window: a slow consumer
+    stalls the pipeline, which in turn stops reading input, keeping memory
+    bounded by ``chunk_size * pipeline_depth`` regardless of list size.
+    """
+    chunks = _chunks(addresses, chunk_size, progress).__aiter__()
+    pending: List["asyncio.Task[List[ValidationResult]]"] = []
+    emails_by_task: Dict["asyncio.Task[List[ValidationResult]]", List[str]] = {}
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) < max(1, pipeline_depth):
+                try:
+                    chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                emails = [email.lower().strip() for email in chunk]
+                task = asyncio.create_task(validator.validate_batch_async(emails))
+                pending.append(task)
+                emails_by_task[task] = emails
+
+            if not pending:
+                break
+
+            task = pending.pop(0)
+            emails = emails_by_task.pop(task)
+            records = [result_record(email, result) for email, result in zip(emails, await task)]
+            valid = sum(1 for record in records if record["valid"])
+            progress.processed += len(records)
+            progress.valid += valid
+            progress.invalid += len(records) - valid
+            yield records
+    finally:
+        for task in pending:
+            task.cancel()
+        progress.done = True
+
+
+def format_ndjson(record: dict) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def format_csv_row(values: List) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(values)
+    return buffer.getvalue()
+
+
+def csv_header() -> str:
+    return format_csv_row(CSV_COLUMNS)
+
+
+def format_csv(record: dict) -> str:
+    checks = record["checks"]
+    return format_csv_row([
+        record["email"],
+        str(record["valid"]).lower(),
+        record["reason"],
+        record["score"],
+        record["suggestion"] or "",
+        str(checks["syntax"]).lower(),
+        str(checks["mx"]).lower(),
+        str(checks["disposable"]).lower(),
+        str(checks["role"]).lower(),
+    ])
+
+
+async def render(batches: AsyncIterable[List[dict]], output_format: str) -> AsyncIterator[str]:
+    """Serialize record batches as NDJSON lines or CSV rows (with header)"""
+    if output_format == "csv":
+        yield csv_header()
+        formatter = format_csv
+    else:
+        formatter = format_ndjson
+    async for records in batches:
+        yield "".join(map(formatter, records))
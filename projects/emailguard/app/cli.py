@@ -0,0 +1,124 @@
+"""
+EmailGuard Command Line Interface
+Bulk-verify CSV/NDJSON address lists without running the API server
+
+Usage:
+    python -m app.cli verify addresses.csv -o results.ndjson
+    python -m app.cli verify - --input-format ndjson --output-format csv < in.ndjson
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import AsyncIterator, Optional, TextIO
+
+from app import bulk
+from app.config import Settings
+from app.validator import EmailValidator
+
+READ_BLOCK_SIZE = 64 * 1024
+
+
+async def _read_blocks(stream) -> AsyncIterator[bytes]:
+    while True:
+        block = stream.read(READ_BLOCK_SIZE)
+        if not block:
+            return
+        yield block
+        await asyncio.sleep(0)
+
+
+def _guess_format(path: str) -> str:
+    suffix = Path(path).suffix.lower()
+    return "ndjson" if suffix in (".ndjson", ".jsonl", ".json") else "csv"
+
+
+def _report(progress: bulk.StreamProgress, out: TextIO, final: bool = False) -> None:
+    stats = progress.snapshot()
+    line = (
+        f"processed={stats['processed']} valid={stats['valid']} "
+        f"invalid={stats['invalid']} rate={stats['emails_per_second']}/s"
+    )
+    out.write(f"\r[emailguard] {line}" + ("\n" if final else ""))
+    out.flush()
+
+
+async def verify_file(
+    source,
+    sink: TextIO,
+    input_format: str,
+    output_format: str,
+    settings: Settings,
+    progress_out: Optional[TextIO] = None,
+    progress_interval: float = 1.0,
+) -> bulk.StreamProgress:
+    """Verify addresses from a binary stream and write results to ``sink``"""
+    validator = EmailValidator(settings)
+    progress = bulk.StreamProgress()
+    addresses = bulk.iter_addresses(bulk.iter_lines(_read_blocks(source)), input_format)
+    batches = bulk.verify_stream(
+        validator,
+        addresses,
+        progress,
+        chunk_size=settings.stream_chunk_size,
+        pipeline_depth=settings.stream_pipeline_depth,
+    )
+
+    last_report = time.monotonic()
+    async for text in bulk.render(batches, output_format):
+        sink.write(text)
+        if progress_out is not None and time.monotonic() - last_report >= progress_interval:
+            _report(progress, progress_out)
+            last_report = time.monotonic()
+
+    sink.flush()
+    if progress_out is not None:
+        _report(progress, progress_out, final=True)
+    return progress
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="emailguard", description="EmailGuard command line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    verify = commands.add_parser("verify", help="Verify a CSV or NDJSON address list")
+    verify.add_argument("input", help="Input file, or - for stdin")
+    verify.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    verify.add_argument("--input-format", choices=bulk.INPUT_FORMATS, help="Default: from file extension")
+    verify.add_argument("--output-format", choices=bulk.OUTPUT_FORMATS, help="Default: from output extension, else ndjson")
+    verify.add_argument("--chunk-size", type=int, help="Addresses per pipelined chunk")
+    verify.add_argument("--quiet", action="store_true", help="Do not print progress to stderr")
+    args = parser.parse_args(argv)
+
+    settings = Settings()
+    if args.chunk_size:
+        settings.stream_chunk_size = args.chunk_size
+
+    input_format = args.input_format or ("csv" if args.input == "-" else _guess_format(args.input))
+    output_format = args.output_format or ("csv" if args.output.lower().endswith(".csv") else "ndjson")
+
+    source = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    try:
+        asyncio.run(verify_file(
+            source,
+            sink,
+            input_format,
+            output_format,
+            settings,
+            progress_out=None if args.quiet else sys.stderr,
+        ))
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
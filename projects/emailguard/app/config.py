@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -18,6 +18,27 @@ class Settings(BaseSettings):
     # Validation settings
     dns_timeout: float = 5.0
     max_batch_size: int = 1000
+    batch_concurrency: int = 50  # unique domains resolved in parallel per batch
+
+    # Streaming bulk verification
+    stream_chunk_size: int = 500
+    stream_pipeline_depth: int = 2  # chunks validated ahead of the output
+
+    # DNS result cache (TTLs in seconds; size 0 disables caching)
+    dns_cache_size: int = 10000
+    dns_cache_min_ttl: int = 60
+    dns_cache_max_ttl: int = 3600
+    dns_cache_negative_max_ttl: int = 900
+
+    # Optional disposable domain list file (one domain per line), merged
+    # with the built-in list below
+    disposable_domains_file: Optional[str] = None
+
+    # Typo suggestions: popular domain list ("domain [weight]" per line,
+    # built-in list if unset) and optional precomputed index snapshot
+    popular_domains_file: Optional[str] = None
+    typo_snapshot_file: Optional[str] = None
+    typo_max_distance: int = 2
 
     # Disposable email domains (built-in list)
     disposable_domains: List[str] = [
@@ -0,0 +1,234 @@
+"""
+EmailGuard DNS Cache
+TTL-aware cache of per-domain mail routing lookups with negative caching
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import dns.exception
+import dns.rdatatype
+
+
+class DNSOutcome(str, Enum):
+    """Cached outcome of resolving a domain's mail routing"""
+    MX = "mx"
+    A = "a"
+    NXDOMAIN = "nxdomain"
+    NO_ANSWER = "no_answer"
+
+    @property
+    def negative(self) -> bool:
+        return self in (DNSOutcome.NXDOMAIN, DNSOutcome.NO_ANSWER)
+
+
+@dataclass(frozen=True)
+class DomainResolution:
+    """Result of resolving MX (and fallback A) records for a domain"""
+    outcome: DNSOutcome
+    hosts: Tuple[str, ...] = ()
+    ttl: Optional[float] = None
+
+
+def negative_ttl(exc: dns.exception.DNSException) -> Optional[float]:
+    """
+    Derive a negative-caching TTL from an NXDOMAIN/NoAnswer exception.
+
+    Per RFC 2308 section 5 this is the lesser of the SOA record's own TTL
+    and its MINIMUM field, taken from the authority section. Returns None
+    when the response carries no SOA.
+    """
+    kwargs = getattr(exc, "kwargs", None) or {}
+    responses = list(kwargs.get("responses", {}).values())
+    if kwargs.get("response") is not None:
+        responses.append(kwargs["response"])
+
+    ttls = [
+        min(rrset.ttl, rrset[0].minimum)
+        for response in responses
+        for rrset in getattr(response, "authority", ())
+        if rrset.rdtype == dns.rdatatype.SOA and len(rrset)
+    ]
+    return min(ttls) if ttls else None
+
+
+class _Flight:
+    """A lookup in progress that concurrent callers wait on"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[DomainResolution] = None
+        self.error: Optional[BaseException] = None
+
+
+class DNSCache:
+    """
+    Size-bounded LRU cache of domain resolutions.
+
+    Positive answers live for their record TTL and negative answers
+    (NXDOMAIN/NoAnswer) for their SOA-derived TTL, both clamped to the
+    configured bounds. Transient failures such as timeouts are never
+    cached. Concurrent lookups of the same uncached domain are coalesced
+    so only one query reaches the resolver.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        min_ttl: float = 60,
+        max_ttl: float = 3600,
+        negative_max_ttl: float = 900,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.negative_max_ttl = negative_max_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, DomainResolution]]" = OrderedDict()
+        self._inflight: Dict[str, _Flight] = {}
+        self._async_inflight: Dict[str, "asyncio.Task[DomainResolution]"] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def _clamp_ttl(self, resolution: DomainResolution) -> float:
+        if resolution.outcome.negative:
+            upper = self.negative_max_ttl
+        else:
+            upper = self.max_ttl
+        if resolution.ttl is None:
+            return self.min_ttl
+        return max(self.min_ttl, min(upper, resolution.ttl))
+
+    def get(self, domain: str) -> Optional[DomainResolution]:
+        """Return the cached resolution for domain if present and fresh"""
+        with self._lock:
+            return self._get_locked(domain)
+
+    def _get_locked(self, domain: str) -> Optional[DomainResolution]:
+        entry = self._entries.get(domain)
+        if entry is None:
+            return None
+        expires_at, resolution = entry
+        if expires_at <= self._clock():
+            del self._entries[domain]
+            return None
+        self._entries.move_to_end(domain)
+        return resolution
+
+    def put(self, domain: str, resolution: DomainResolution) -> None:
+        """Store a resolution, evicting least recently used entries"""
+        if self.max_entries <= 0:
+            return
+        expires_at = self._clock() + self._clamp_ttl(resolution)
+        with self._lock:
+            self._entries[domain] = (expires_at, resolution)
+            self._entries.move_to_end(domain)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_resolve(
+        self, domain: str, resolve: Callable[[str], DomainResolution]
+    ) -> DomainResolution:
+        """
+        Return a cached resolution or run ``resolve(domain)`` once.
+
+        Callers arriving while a lookup for the same domain is in flight
+        wait for it and share its result or exception.
+        """
+        with self._lock:
+            cached = self._get_locked(domain)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            flight = self._inflight.get(domain)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[domain] = _Flight()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = resolve(domain)
+            self.put(domain, flight.result)
+            return flight.result
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(domain, None)
+            flight.done.set()
+
+    async def get_or_resolve_async(
+        self, domain: str, resolve: Callable[[str], Awaitable[DomainResolution]]
+    ) -> DomainResolution:
+        """
+        Async variant of ``get_or_resolve()``.
+
+        The lookup runs as a shared task that every concurrent caller
+        awaits through ``asyncio.shield()``: cancelling one caller (e.g. a
+        disconnected client) does not abort the lookup for the others, and
+        the task still populates the cache when it completes.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            cached = self._get_locked(domain)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            task = self._async_inflight.get(domain)
+            if task is not None and task.get_loop() is loop:
+                self.coalesced += 1
+            else:
+                task = loop.create_task(self._resolve_and_store(domain, resolve))
+                self._async_inflight[domain] = task
+                self.misses += 1
+        return await asyncio.shield(task)
+
+    async def _resolve_and_store(
+        self, domain: str, resolve: Callable[[str], Awaitable[DomainResolution]]
+    ) -> DomainResolution:
+        try:
+            resolution = await resolve(domain)
+            self.put(domain, resolution)
+            return resolution
+        finally:
+            with self._lock:
+                if self._async_inflight.get(domain) is asyncio.current_task():
+                    del self._async_inflight[domain]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        """Cache counters; coalesced lookups count as hits for the ratio"""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,75 @@
+"""
+EmailGuard Domain Indexes
+Precompiled lookup structures for disposable domains and role prefixes
+"""
+
+from itertools import chain
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+
+def normalize_domain(domain: str) -> str:
+    """Lower-case a domain and strip surrounding whitespace and dots"""
+    return domain.strip().strip(".").lower()
+
+
+def iter_domain_file(path: Union[str, Path]) -> Iterator[str]:
+    """
+    Yield domains from a plain-text list.
+
+    One domain per line; blank lines and ``#`` comments are ignored.
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                yield line
+
+
+class DomainIndex:
+    """
+    Hashed domain set with suffix matching.
+
+    A domain matches when it, or any parent domain, is in the index, so
+    ``mx.mailinator.com`` is caught by ``mailinator.com``. Candidates are
+    probed label by label from the TLD inwards, so a lookup costs at most
+    one set probe per label regardless of index size.
+    """
+
+    __slots__ = ("_domains",)
+
+    def __init__(self, domains: Iterable[str] = ()):
+        self._domains = frozenset(
+            d for d in (normalize_domain(d) for d in domains) if d
+        )
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path], extra: Iterable[str] = ()) -> "DomainIndex":
+        """Build an index from a domain list file plus optional extra domains"""
+        return cls(chain(iter_domain_file(path), extra))
+
+    def match(self, domain: str) -> Optional[str]:
+        """
+        Return the indexed domain that covers ``domain``, if any.
+
+        ``domain`` is expected to be normalized already (lower-case, no
+        trailing dot), as produced by the validator.
+        """
+        domains = self._domains
+        pos = domain.rfind(".")
+        while pos != -1:
+            pos = domain.rfind(".", 0, pos)
+            candidate = domain[pos + 1:]
+            if candidate in domains:
+                return candidate
+        return None
+
+    def __contains__(self, domain: str) -> bool:
+        return self.match(domain) is not None
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self._domains))
+
@@ -8,8 +8,10 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from app.bulk import StreamRegistry
 from app.config import Settings
 from app.routes import router
+from app.validator import EmailValidator
 
 
 def create_app(settings: Settings = None) -> FastAPI:
@@ -57,6 +59,11 @@ curl -X POST http://localhost:8000/v1/verify \\
         openapi_url="/openapi.json"
     )
 
+    # App-scoped state shared by all requests
+    app.state.settings = settings
+    app.state.validator = EmailValidator(settings)
+    app.state.streams = StreamRegistry()
+
     # CORS middleware
     app.add_middleware(
         CORSMiddleware,
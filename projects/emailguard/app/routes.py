@@ -4,9 +4,12 @@ FastAPI endpoints for email validation
 """
 
 import time
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app import bulk
 
 from app.config import Settings
 from app.models import (
@@ -24,14 +27,19 @@ router = APIRouter()
 START_TIME = time.time()
 
 
-def get_settings() -> Settings:
-    """Dependency to get settings"""
-    return Settings()
+def get_settings(request: Request) -> Settings:
+    """Dependency to get the app-scoped settings"""
+    return request.app.state.settings
 
 
-def get_validator(settings: Settings = Depends(get_settings)) -> EmailValidator:
-    """Dependency to get validator instance"""
-    return EmailValidator(settings)
+def get_validator(request: Request) -> EmailValidator:
+    """
+    Dependency to get the app-scoped validator.
+
+    The validator (and its compiled indexes and DNS resolver) is built once
+    in ``create_app()`` and shared by every request.
+    """
+    return request.app.state.validator
 
 
 @router.get("/health", response_model=HealthResponse, tags=["System"])
@@ -47,6 +55,20 @@ async def health_check():
     )
 
 
+@router.get("/v1/stats", tags=["System"])
+async def service_stats(
+    validator: EmailValidator = Depends(get_validator)
+):
+    """
+    Runtime statistics.
+
+    Returns DNS cache size, hit/miss counters and hit ratio.
+    """
+    return {
+        "dns_cache": validator.dns_cache.stats()
+    }
+
+
 @router.post("/v1/verify", response_model=VerifyResponse, tags=["Validation"])
 async def verify_email(
     request: VerifyRequest,
@@ -69,7 +91,7 @@ async def verify_email(
     """
     email = request.email.lower().strip()
 
-    valid, reason, checks, score, suggestion = validator.validate_email(email)
+    valid, reason, checks, score, suggestion = await validator.validate_email_async(email)
 
     return VerifyResponse(
         email=email,
@@ -89,7 +111,8 @@ async def verify_batch(
     """
     Verify multiple email addresses in a single request.
 
-    Maximum 1000 emails per batch.
+    Maximum 1000 emails per batch. Each distinct domain is resolved once
+    and results are returned in request order.
 
     Returns:
     - Total count
@@ -102,13 +125,13 @@ async def verify_batch(
             detail="Maximum batch size is 1000 emails"
         )
 
+    emails = [email.lower().strip() for email in request.emails]
     results: List[VerifyResponse] = []
     valid_count = 0
 
-    for email in request.emails:
-        email = email.lower().strip()
-        valid, reason, checks, score, suggestion = validator.validate_email(email)
-
+    for email, (valid, reason, checks, score, suggestion) in zip(
+        emails, await validator.validate_batch_async(emails)
+    ):
         results.append(VerifyResponse(
             email=email,
             valid=valid,
@@ -129,18 +152,92 @@ async def verify_batch(
     )
 
 
+class BodyStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that may keep reading the request body while sending.
+
+    Starlette's StreamingResponse consumes ``receive()`` to watch for
+    disconnects, which would swallow the request body chunks a streaming
+    endpoint is still reading. Disconnects surface instead as
+    ``ClientDisconnect`` from ``request.stream()``.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+def _stream_formats(request: Request, output: Optional[str]) -> "tuple[str, str]":
+    content_type = request.headers.get("content-type", "")
+    input_format = "ndjson" if "json" in content_type else "csv"
+    if output is None:
+        output = "csv" if "text/csv" in request.headers.get("accept", "") else "ndjson"
+    return input_format, output
+
+
+@router.post("/v1/verify/stream", tags=["Validation"])
+async def verify_stream(
+    request: Request,
+    output: Optional[str] = Query(default=None, pattern="^(ndjson|csv)$"),
+    validator: EmailValidator = Depends(get_validator)
+):
+    """
+    Verify an arbitrarily large list, streaming results as they complete.
+
+    The request body is read incrementally:
+    - `Content-Type: application/x-ndjson` - one JSON string or
+      `{"email": ...}` object per line
+    - anything else - CSV with an `email` header column, or one address
+      per line
+
+    Results stream back as NDJSON (default) or CSV (`?output=csv` or
+    `Accept: text/csv`). Progress is available at
+    `/v1/verify/stream/{stream_id}` using the `X-Stream-Id` header.
+    """
+    settings = request.app.state.settings
+    input_format, output_format = _stream_formats(request, output)
+    stream_id, progress = request.app.state.streams.register()
+
+    addresses = bulk.iter_addresses(bulk.iter_lines(request.stream()), input_format)
+    batches = bulk.verify_stream(
+        validator,
+        addresses,
+        progress,
+        chunk_size=settings.stream_chunk_size,
+        pipeline_depth=settings.stream_pipeline_depth,
+    )
+    media_type = "text/csv" if output_format == "csv" else "application/x-ndjson"
+    return BodyStreamingResponse(
+        bulk.render(batches, output_format),
+        media_type=media_type,
+        headers={"X-Stream-Id": stream_id},
+    )
+
+
+@router.get("/v1/verify/stream/{stream_id}", tags=["Validation"])
+async def stream_progress(stream_id: str, request: Request):
+    """Progress counters for a running or recently finished stream"""
+    progress = request.app.state.streams.get(stream_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="Unknown stream")
+    return progress.snapshot()
+
+
 @router.get("/v1/disposable-domains", tags=["Data"])
 async def list_disposable_domains(
-    settings: Settings = Depends(get_settings)
+    validator: EmailValidator = Depends(get_validator)
 ):
     """
     List all known disposable email domains.
 
-    Useful for client-side validation.
+    Useful for client-side validation. Subdomains of listed domains are
+    also treated as disposable.
     """
+    index = validator.disposable_index
     return {
-        "domains": settings.disposable_domains,
-        "count": len(settings.disposable_domains)
+        "domains": list(index),
+        "count": len(index)
     }
 
 
@@ -0,0 +1,219 @@
+"""
+EmailGuard Typo Suggestions
+SymSpell-style deletion index over popular mailbox domains, ranked by a
+keyboard-aware edit distance and domain popularity
+"""
+
+import math
+import pickle
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Mapping, Optional, Set, Tuple, Union
+
+# Popular mailbox domains with relative weights (higher = more common)
+DEFAULT_POPULAR_DOMAINS: Dict[str, float] = {
+    "gmail.com": 1000, "yahoo.com": 400, "hotmail.com": 300, "outlook.com": 300,
+    "icloud.com": 150, "aol.com": 100, "live.com": 80, "qq.com": 60,
+    "msn.com": 50, "163.com": 50, "me.com": 40, "mail.com": 40,
+    "protonmail.com": 40, "yandex.ru": 40, "mail.ru": 40, "proton.me": 30,
+    "gmx.com": 30, "gmx.de": 30, "web.de": 30, "126.com": 30,
+    "comcast.net": 30, "yahoo.co.uk": 30, "hotmail.co.uk": 30, "googlemail.com": 20,
+    "ymail.com": 20, "verizon.net": 20, "att.net": 20, "sbcglobal.net": 20,
+    "t-online.de": 15, "orange.fr": 15, "hotmail.fr": 15, "btinternet.com": 15,
+    "live.co.uk": 10, "free.fr": 10, "libero.it": 10, "rocketmail.com": 10,
+    "zoho.com": 10, "fastmail.com": 10, "yahoo.fr": 10, "yahoo.de": 10,
+    "hotmail.de": 10, "outlook.de": 10, "cox.net": 10, "charter.net": 10,
+    "earthlink.net": 5, "juno.com": 5, "bellsouth.net": 5, "shaw.ca": 5,
+    "rogers.com": 5, "sky.com": 5, "virginmedia.com": 5, "laposte.net": 5,
+}
+
+SNAPSHOT_VERSION = 1
+
+# Up to this fraction of one edit is credited to the most popular domain
+POPULARITY_BONUS = 0.25
+
+_KEYBOARD_ROWS = ("1234567890-", "qwertyuiop", "asdfghjkl", "zxcvbnm")
+
+
+def _keyboard_neighbours() -> Dict[str, FrozenSet[str]]:
+    """Map each key to the keys physically adjacent on a QWERTY layout"""
+    positions = {
+        key: (row, col + 0.5 * row)
+        for row, keys in enumerate(_KEYBOARD_ROWS)
+        for col, key in enumerate(keys)
+    }
+    return {
+        key: frozenset(
+            other for other, (r2, c2) in positions.items()
+            if other != key and abs(r - r2) <= 1 and abs(c - c2) <= 1
+        )
+        for key, (r, c) in positions.items()
+    }
+
+
+KEYBOARD_NEIGHBOURS = _keyboard_neighbours()
+
+
+def keyboard_distance(source: str, target: str) -> float:
+    """
+    Weighted optimal-string-alignment distance.
+
+    Insertions, deletions and substitutions cost 1, except that typing a
+    keyboard-adjacent key, doubling a key, or swapping two neighbouring
+    characters is cheaper, since those are the typos people actually make.
+    """
+    rows, cols = len(source) + 1, len(target) + 1
+    dist = [[0.0] * cols for _ in range(rows)]
+    for i in range(rows):
+        dist[i][0] = float(i)
+    for j in range(cols):
+        dist[0][j] = float(j)
+
+    for i in range(1, rows):
+        s = source[i - 1]
+        for j in range(1, cols):
+            t = target[j - 1]
+            if s == t:
+                sub = 0.0
+            elif t in KEYBOARD_NEIGHBOURS.get(s, ()):
+                sub = 0.5
+            else:
+                sub = 1.0
+            # Extra character in source; cheap if it repeats its neighbour
+            delete = 0.5 if i > 1 and source[i - 2] == s else 1.0
+            insert = 0.5 if j > 1 and target[j - 2] == t else 1.0
+            best = min(dist[i - 1][j] + delete, dist[i][j - 1] + insert, dist[i - 1][j - 1] + sub)
+            if i > 1 and j > 1 and s == target[j - 2] and source[i - 2] == t:
+                best = min(best, dist[i - 2][j - 2] + 0.75)
+            dist[i][j] = best
+    return dist[-1][-1]
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """All strings obtained by deleting up to ``max_distance`` characters"""
+    variants = {word}
+    for n in range(1, min(max_distance, len(word)) + 1):
+        for positions in combinations(range(len(word)), n):
+            variants.add("".join(c for k, c in enumerate(word) if k not in positions))
+    return variants
+
+
+def iter_weighted_domains(path: Union[str, Path]) -> Iterator[Tuple[str, float]]:
+    """
+    Yield ``(domain, weight)`` pairs from a popular-domain list.
+
+    One domain per line, optionally followed by a weight; weight defaults
+    to 1. Blank lines and ``#`` comments are ignored.
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            parts = line.split("#", 1)[0].split()
+            if not parts:
+                continue
+            weight = float(parts[1]) if len(parts) > 1 else 1.0
+            yield parts[0].lower(), weight
+
+
+class TypoSuggester:
+    """
+    Domain typo corrector.
+
+    Candidates are found through a deletion index: every known domain is
+    stored under itself and each single-character deletion of itself, and
+    a lookup probes the input with up to ``max_distance`` deletions. That
+    catches insertions, omissions, substitutions and transpositions while
+    keeping the index at roughly ``len(domain)`` entries per domain, and a
+    lookup touches a few dozen buckets instead of scanning all domains. Each
+    candidate is then scored with ``keyboard_distance()`` minus a small
+    log-scaled popularity bonus, so near-ties favour common providers.
+    """
+
+    def __init__(self, domains: Mapping[str, float], max_distance: int = 2):
+        self.max_distance = max_distance
+        self._domains: List[str] = list(domains)
+        self._weights: List[float] = [float(domains[d]) for d in self._domains]
+        self._known: FrozenSet[str] = frozenset(self._domains)
+        self._bonus = self._popularity_bonus(self._weights)
+        self._index: Dict[str, List[int]] = {}
+        for i, domain in enumerate(self._domains):
+            for variant in _deletes(domain, 1):
+                self._index.setdefault(variant, []).append(i)
+
+    @staticmethod
+    def _popularity_bonus(weights: List[float]) -> List[float]:
+        top = math.log1p(max(weights, default=0))
+        if top <= 0:
+            return [0.0] * len(weights)
+        return [POPULARITY_BONUS * math.log1p(max(w, 0)) / top for w in weights]
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path], **kwargs) -> "TypoSuggester":
+        return cls(dict(iter_weighted_domains(path)), **kwargs)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TypoSuggester":
+        """Load a snapshot written by ``save()`` (trusted local files only)"""
+        with open(path, "rb") as fh:
+            state = pickle.load(fh)
+        if state.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported typo snapshot version: {state.get('version')}")
+        suggester = cls.__new__(cls)
+        suggester.max_distance = state["max_distance"]
+        suggester._domains = state["domains"]
+        suggester._weights = state["weights"]
+        suggester._known = frozenset(suggester._domains)
+        suggester._bonus = cls._popularity_bonus(suggester._weights)
+        suggester._index = state["index"]
+        return suggester
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the precomputed index so later startups can skip building it"""
+        state = {
+            "version": SNAPSHOT_VERSION,
+            "max_distance": self.max_distance,
+            "domains": self._domains,
+            "weights": self._weights,
+            "index": self._index,
+        }
+        tmp = Path(f"{path}.tmp")
+        with open(tmp, "wb") as fh:
+            pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(path)
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    def __contains__(self, domain: str) -> bool:
+        return domain in self._known
+
+    def suggest(self, domain: str) -> Optional[str]:
+        """
+        Return the most likely intended domain, or None.
+
+        Known domains are never corrected. Short domains only accept a
+        single edit, since two edits can turn almost any short domain into
+        another real one.
+        """
+        if domain in self._known or not domain:
+            return None
+
+        limit = self.max_distance if len(domain) >= 8 else min(1, self.max_distance)
+        seen: Set[int] = set()
+        best: Optional[Tuple[float, float, str]] = None
+
+        for variant in _deletes(domain, self.max_distance):
+            for i in self._index.get(variant, ()):
+                if i in seen:
+                    continue
+                seen.add(i)
+                candidate = self._domains[i]
+                if abs(len(candidate) - len(domain)) > limit:
+                    continue
+                distance = keyboard_distance(domain, candidate)
+                if distance > limit:
+                    continue
+                key = (distance - self._bonus[i], -self._weights[i], candidate)
+                if best is None or key < best:
+                    best = key
+
+        return best[2] if best else None
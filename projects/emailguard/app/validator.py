@@ -3,13 +3,46 @@ EmailGuard Validator Engine
 Core email validation logic with multiple verification methods
 """
 
+import asyncio
+import os
 import re
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
 
+import dns.asyncresolver
+import dns.exception
 import dns.resolver
 
 from app.config import Settings
+from app.dns_cache import DNSCache, DNSOutcome, DomainResolution, negative_ttl
+from app.domain_index import DomainIndex
 from app.models import EmailCheckResult, ValidationReason
+from app.suggest import DEFAULT_POPULAR_DOMAINS, TypoSuggester
+
+ValidationResult = Tuple[bool, ValidationReason, EmailCheckResult, int, Optional[str]]
+
+
+@dataclass
+class _CheckState:
+    """Intermediate state between local checks and the DNS stage"""
+    email: str
+    checks: EmailCheckResult
+    domain: str = ""
+    score: int = 0
+    suggestion: Optional[str] = None
+    result: Optional[ValidationResult] = None
+
+
+def _mx_resolution(answer) -> DomainResolution:
+    hosts = tuple(
+        str(r.exchange).rstrip(".")
+        for r in sorted(answer, key=lambda r: r.preference)
+    )
+    return DomainResolution(DNSOutcome.MX, hosts, answer.rrset.ttl)
+
+
+def _a_resolution(answer) -> DomainResolution:
+    return DomainResolution(DNSOutcome.A, tuple(r.address for r in answer), answer.rrset.ttl)
 
 
 class EmailValidator:
@@ -26,36 +59,115 @@ class EmailValidator:
         r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
     )
 
-    # Common typo corrections
-    DOMAIN_CORRECTIONS = {
-        "gmail.co": "gmail.com",
-        "gmail.cm": "gmail.com",
-        "gmail.cmo": "gmail.com",
-        "gmial.com": "gmail.com",
-        "gmal.com": "gmail.com",
-        "gmail.comm": "gmail.com",
-        "yahoo.co": "yahoo.com",
-        "yahoo.cm": "yahoo.com",
-        "yaho.com": "yahoo.com",
-        "hotmail.co": "hotmail.com",
-        "hotmal.com": "hotmail.com",
-        "outlook.co": "outlook.com",
-        "outloo.com": "outlook.com",
-    }
-
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, dns_cache: Optional[DNSCache] = None):
         self.settings = settings
+        if dns_cache is None:
+            dns_cache = DNSCache(
+                max_entries=settings.dns_cache_size,
+                min_ttl=settings.dns_cache_min_ttl,
+                max_ttl=settings.dns_cache_max_ttl,
+                negative_max_ttl=settings.dns_cache_negative_max_ttl,
+            )
+        self.dns_cache = dns_cache
+        self.disposable_index = self._build_disposable_index(settings)
+        self.role_prefixes = frozenset(p.lower() for p in settings.role_prefixes)
+        self.suggester = self._build_suggester(settings)
         self._dns_resolver = dns.resolver.Resolver()
         self._dns_resolver.timeout = settings.dns_timeout
         self._dns_resolver.lifetime = settings.dns_timeout
+        self._async_resolver = dns.asyncresolver.Resolver()
+        self._async_resolver.timeout = settings.dns_timeout
+        self._async_resolver.lifetime = settings.dns_timeout
+
+    @staticmethod
+    def _build_disposable_index(settings: Settings) -> DomainIndex:
+        """Compile the built-in and file-based disposable lists into one index"""
+        if settings.disposable_domains_file:
+            return DomainIndex.from_file(
+                settings.disposable_domains_file, settings.disposable_domains
+            )
+        return DomainIndex(settings.disposable_domains)
+
+    @staticmethod
+    def _build_suggester(settings: Settings) -> TypoSuggester:
+        """
+        Load the typo index from its snapshot, or build it and write one.
 
-    def validate_email(self, email: str) -> Tuple[bool, ValidationReason, EmailCheckResult, int, Optional[str]]:
+        The snapshot is rebuilt when the domain list is newer or the
+        distance setting has changed.
+        """
+        snapshot = settings.typo_snapshot_file
+        source = settings.popular_domains_file
+        if snapshot and os.path.exists(snapshot) and (
+            not source or os.path.getmtime(source) <= os.path.getmtime(snapshot)
+        ):
+            suggester = TypoSuggester.load(snapshot)
+            if suggester.max_distance == settings.typo_max_distance:
+                return suggester
+
+        if source:
+            suggester = TypoSuggester.from_file(source, max_distance=settings.typo_max_distance)
+        else:
+            suggester = TypoSuggester(DEFAULT_POPULAR_DOMAINS, max_distance=settings.typo_max_distance)
+
+        if snapshot:
+            suggester.save(snapshot)
+        return suggester
+
+    def validate_email(self, email: str) -> ValidationResult:
         """
         Validate an email address through multiple checks.
 
+        Blocking variant for scripts and tests; request handlers should
+        use ``validate_email_async()``.
+
+        Returns:
+            Tuple of (is_valid, reason, check_results, score, suggestion)
+        """
+        state = self._local_checks(email)
+        if state.result is not None:
+            return state.result
+        return self._finalize(state, self._validate_mx(state.domain))
+
+    async def validate_email_async(self, email: str) -> ValidationResult:
+        """
+        Validate an email address without blocking the event loop.
+
         Returns:
             Tuple of (is_valid, reason, check_results, score, suggestion)
         """
+        state = self._local_checks(email)
+        if state.result is not None:
+            return state.result
+        return self._finalize(state, await self._validate_mx_async(state.domain))
+
+    async def validate_batch_async(self, emails: Sequence[str]) -> List[ValidationResult]:
+        """
+        Validate many addresses, resolving each unique domain once.
+
+        All addresses are normalized and run through the local checks
+        first; the distinct domains that still need DNS are then resolved
+        concurrently (bounded by ``batch_concurrency``) and the verdicts
+        fanned back out. Results are returned in input order.
+        """
+        states = [self._local_checks(email) for email in emails]
+        domains = list(dict.fromkeys(s.domain for s in states if s.result is None))
+
+        semaphore = asyncio.Semaphore(max(1, self.settings.batch_concurrency))
+
+        async def resolve(domain: str) -> Tuple[bool, int]:
+            async with semaphore:
+                return await self._validate_mx_async(domain)
+
+        mx_results = dict(zip(domains, await asyncio.gather(*map(resolve, domains))))
+
+        return [
+            s.result if s.result is not None else self._finalize(s, mx_results[s.domain])
+            for s in states
+        ]
+
+    def _local_checks(self, email: str) -> "_CheckState":
+        """Run every check that needs no network I/O"""
         email = email.lower().strip()
 
         # Initialize check results
@@ -65,43 +177,50 @@ class EmailValidator:
             disposable=False,
             role=False
         )
-
-        score = 0
-        suggestion = None
+        state = _CheckState(email=email, checks=checks)
 
         # Step 1: Syntax validation
         syntax_valid, syntax_score = self._validate_syntax(email)
         checks.syntax = syntax_valid
 
         if not syntax_valid:
-            return False, ValidationReason.INVALID_SYNTAX, checks, syntax_score, None
+            state.result = (False, ValidationReason.INVALID_SYNTAX, checks, syntax_score, None)
+            return state
 
-        score += syntax_score
+        state.score += syntax_score
 
         # Extract domain
         local_part, domain = email.split("@", 1)
+        state.domain = domain
 
         # Check for domain typos
-        if domain in self.DOMAIN_CORRECTIONS:
-            suggestion = email.replace(domain, self.DOMAIN_CORRECTIONS[domain])
+        corrected = self.suggester.suggest(domain)
+        if corrected:
+            state.suggestion = f"{local_part}@{corrected}"
 
         # Step 2: Check for disposable email
-        is_disposable = self._is_disposable(domain)
-        checks.disposable = is_disposable
+        checks.disposable = self._is_disposable(domain)
 
-        if is_disposable:
-            score -= 50
+        if checks.disposable:
+            state.score -= 50
             # Still continue with other checks
 
         # Step 3: Check for role-based email
-        is_role = self._is_role_email(local_part)
-        checks.role = is_role
+        checks.role = self._is_role_email(local_part)
+
+        if checks.role:
+            state.score -= 20
 
-        if is_role:
-            score -= 20
+        return state
+
+    def _finalize(self, state: "_CheckState", mx_result: Tuple[bool, int]) -> ValidationResult:
+        """Combine local check state with the DNS MX result"""
+        checks = state.checks
+        score = state.score
+        suggestion = state.suggestion
 
         # Step 4: DNS MX validation
-        mx_valid, mx_score = self._validate_mx(domain)
+        mx_valid, mx_score = mx_result
         checks.mx = mx_valid
 
         if not mx_valid:
@@ -114,7 +233,7 @@ class EmailValidator:
         score = max(0, min(100, score))
 
         # Determine validity
-        if is_disposable:
+        if checks.disposable:
             return False, ValidationReason.DISPOSABLE, checks, score, suggestion
 
         valid = score >= 50
@@ -156,46 +275,99 @@ class EmailValidator:
 
     def _validate_mx(self, domain: str) -> Tuple[bool, int]:
         """
-        Validate MX record exists for domain.
+        Validate MX record exists for domain (blocking).
+
+        Lookups go through the shared DNS cache, so repeated domains are
+        resolved once per TTL.
 
         Returns:
             Tuple of (has_mx, score_contribution)
         """
         try:
-            # Try MX records first
-            mx_records = self._dns_resolver.resolve(domain, "MX")
-            if mx_records:
-                return True, 60
+            resolution = self.dns_cache.get_or_resolve(domain, self._resolve_domain)
+        except dns.exception.DNSException:
+            # DNS timeout - give benefit of doubt but lower score
+            return True, 30
+        except Exception:
+            return False, 0
+        return self._score_resolution(resolution)
 
-            # Fallback to A record (some domains accept email without MX)
-            a_records = self._dns_resolver.resolve(domain, "A")
-            if a_records:
-                return True, 50
+    async def _validate_mx_async(self, domain: str) -> Tuple[bool, int]:
+        """
+        Validate MX record exists for domain using the async resolver.
 
-            return False, 0
+        Each lookup is bounded by ``dns_timeout``; concurrent lookups for
+        the same domain share one query.
 
-        except dns.resolver.NXDOMAIN:
-            return False, 0
-        except dns.resolver.NoAnswer:
-            # No MX record, check for A record
-            try:
-                self._dns_resolver.resolve(domain, "A")
-                return True, 50
-            except Exception:
-                return False, 0
-        except (dns.resolver.Timeout, dns.exception.DNSException):
+        Returns:
+            Tuple of (has_mx, score_contribution)
+        """
+        try:
+            resolution = await self.dns_cache.get_or_resolve_async(
+                domain, self._resolve_domain_deadline
+            )
+        except (dns.exception.DNSException, asyncio.TimeoutError):
             # DNS timeout - give benefit of doubt but lower score
             return True, 30
         except Exception:
             return False, 0
+        return self._score_resolution(resolution)
+
+    @staticmethod
+    def _score_resolution(resolution: DomainResolution) -> Tuple[bool, int]:
+        if resolution.outcome == DNSOutcome.MX:
+            return True, 60
+        if resolution.outcome == DNSOutcome.A:
+            # Some domains accept email without MX
+            return True, 50
+        return False, 0
+
+    def _resolve_domain(self, domain: str) -> DomainResolution:
+        """
+        Resolve MX records, falling back to A records.
+
+        NXDOMAIN and NoAnswer become negative resolutions; timeouts and
+        other resolver failures propagate so they are not cached.
+        """
+        try:
+            return _mx_resolution(self._dns_resolver.resolve(domain, "MX"))
+        except dns.resolver.NXDOMAIN as exc:
+            return DomainResolution(DNSOutcome.NXDOMAIN, ttl=negative_ttl(exc))
+        except dns.resolver.NoAnswer:
+            pass
+
+        try:
+            return _a_resolution(self._dns_resolver.resolve(domain, "A"))
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as exc:
+            return DomainResolution(DNSOutcome.NO_ANSWER, ttl=negative_ttl(exc))
+
+    async def _resolve_domain_async(self, domain: str) -> DomainResolution:
+        """Async counterpart of ``_resolve_domain()``"""
+        try:
+            return _mx_resolution(await self._async_resolver.resolve(domain, "MX"))
+        except dns.resolver.NXDOMAIN as exc:
+            return DomainResolution(DNSOutcome.NXDOMAIN, ttl=negative_ttl(exc))
+        except dns.resolver.NoAnswer:
+            pass
+
+        try:
+            return _a_resolution(await self._async_resolver.resolve(domain, "A"))
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as exc:
+            return DomainResolution(DNSOutcome.NO_ANSWER, ttl=negative_ttl(exc))
+
+    async def _resolve_domain_deadline(self, domain: str) -> DomainResolution:
+        """Resolve a domain, cancelling the lookup after ``dns_timeout``"""
+        return await asyncio.wait_for(
+            self._resolve_domain_async(domain), timeout=self.settings.dns_timeout
+        )
 
     def _is_disposable(self, domain: str) -> bool:
-        """Check if domain is a known disposable email provider"""
-        return domain in self.settings.disposable_domains
+        """Check if domain, or a parent domain, is a known disposable provider"""
+        return domain in self.disposable_index
 
     def _is_role_email(self, local_part: str) -> bool:
         """Check if email is a role-based address"""
-        return local_part in self.settings.role_prefixes
+        return local_part in self.role_prefixes
 
 
 # Utility function for quick validation
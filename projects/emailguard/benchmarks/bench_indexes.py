@@ -0,0 +1,52 @@
+"""
+Benchmark: per-request validator construction and disposable lookups
+
+Compares the old per-request ``Settings()`` + ``EmailValidator()`` build
+against the app-scoped validator, and linear list scans against the
+compiled ``DomainIndex`` with 200k disposable domains.
+
+Usage:
+    python -m benchmarks.bench_indexes
+"""
+
+import timeit
+
+from app.config import Settings
+from app.domain_index import DomainIndex
+from app.validator import EmailValidator
+
+DOMAIN_COUNT = 200_000
+
+
+def _report(label: str, seconds: float, iterations: int) -> None:
+    print(f"  {label:<40} {seconds / iterations * 1e6:10.2f} us/op")
+
+
+def bench_construction(iterations: int = 2_000) -> None:
+    print("Validator setup per request")
+    settings = Settings()
+    shared = EmailValidator(settings)
+
+    seconds = timeit.timeit(lambda: EmailValidator(Settings()), number=iterations)
+    _report("Settings() + EmailValidator()", seconds, iterations)
+
+    seconds = timeit.timeit(lambda: shared, number=iterations)
+    _report("app-scoped validator", seconds, iterations)
+
+
+def bench_lookups(iterations: int = 200) -> None:
+    print(f"Disposable lookup with {DOMAIN_COUNT:,} domains")
+    domains = [f"disposable{i}.example" for i in range(DOMAIN_COUNT)]
+    index = DomainIndex(domains)
+    probes = ["gmail.com", "mx.disposable123456.example", "disposable199999.example"]
+
+    seconds = timeit.timeit(lambda: [p in domains for p in probes], number=iterations)
+    _report("List[str] scan", seconds, iterations * len(probes))
+
+    seconds = timeit.timeit(lambda: [p in index for p in probes], number=iterations * 1000)
+    _report("DomainIndex (suffix match)", seconds, iterations * 1000 * len(probes))
+
+
+if __name__ == "__main__":
+    bench_construction()
+    bench_lookups()
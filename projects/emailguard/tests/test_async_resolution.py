@@ -0,0 +1,110 @@
+"""
+Tests for non-blocking DNS resolution in the validator and API
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.config import Settings
+from app.dns_cache import DNSOutcome, DomainResolution
+from app.main import create_app
+from app.models import ValidationReason
+from app.validator import EmailValidator
+
+
+def slow_resolver(delay: float, calls: list):
+    async def resolve(domain: str) -> DomainResolution:
+        calls.append(domain)
+        await asyncio.sleep(delay)
+        return DomainResolution(DNSOutcome.MX, (f"mx.{domain}",), 300)
+    return resolve
+
+
+@pytest.fixture
+def validator():
+    return EmailValidator(Settings(dns_timeout=0.2))
+
+
+class TestAsyncValidator:
+    """Test async validation path"""
+
+    @pytest.mark.asyncio
+    async def test_valid_email(self, validator):
+        validator._resolve_domain_async = slow_resolver(0, [])
+        valid, reason, checks, score, _ = await validator.validate_email_async("User@Gmail.com")
+        assert valid is True
+        assert reason == ValidationReason.VALID
+        assert checks.mx is True
+
+    @pytest.mark.asyncio
+    async def test_syntax_failure_skips_dns(self, validator):
+        calls = []
+        validator._resolve_domain_async = slow_resolver(0, calls)
+        valid, reason, _, _, _ = await validator.validate_email_async("not-an-email")
+        assert reason == ValidationReason.INVALID_SYNTAX
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_coalesced(self, validator):
+        calls = []
+        validator._resolve_domain_async = slow_resolver(0.05, calls)
+        results = await asyncio.gather(*(
+            validator.validate_email_async(f"user{i}@gmail.com") for i in range(50)
+        ))
+        assert calls == ["gmail.com"]
+        assert all(r[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_lookup_deadline(self, validator):
+        validator._resolve_domain_async = slow_resolver(5, [])
+        started = time.monotonic()
+        mx_valid, mx_score = await validator._validate_mx_async("slow.example")
+        assert time.monotonic() - started < 1
+        # Timeouts keep the benefit-of-doubt score and are not cached
+        assert (mx_valid, mx_score) == (True, 30)
+        assert validator.dns_cache.get("slow.example") is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_abort_shared_lookup(self, validator):
+        calls = []
+        validator._resolve_domain_async = slow_resolver(0.05, calls)
+        first = asyncio.create_task(validator.validate_email_async("a@gmail.com"))
+        second = asyncio.create_task(validator.validate_email_async("b@gmail.com"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        valid, _, _, _, _ = await second
+        assert valid is True
+        assert first.cancelled()
+        assert calls == ["gmail.com"]
+
+
+class TestNonBlockingAPI:
+    """Test slow lookups do not stall the worker"""
+
+    @pytest.mark.asyncio
+    async def test_health_responsive_during_slow_lookups(self):
+        app = create_app(Settings(dns_timeout=2.0))
+        calls = []
+        app.state.validator._resolve_domain_async = slow_resolver(0.5, calls)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            lookups = [
+                asyncio.create_task(client.post("/v1/verify", json={"email": f"u@d{i}.example"}))
+                for i in range(500)
+            ]
+            while len(calls) < 500:
+                await asyncio.sleep(0.01)
+
+            started = time.monotonic()
+            health = await client.get("/health")
+            elapsed = time.monotonic() - started
+
+            responses = await asyncio.gather(*lookups)
+
+        assert health.status_code == 200
+        assert elapsed < 0.25
+        assert all(r.status_code == 200 for r in responses)
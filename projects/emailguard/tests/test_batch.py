@@ -0,0 +1,101 @@
+"""
+Tests for domain-deduplicated batch verification
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.dns_cache import DNSOutcome, DomainResolution
+from app.main import create_app
+from app.models import ValidationReason
+from app.validator import EmailValidator
+
+
+class TrackingResolver:
+    """Async resolver stand-in that records calls and peak concurrency"""
+
+    def __init__(self, delay: float = 0.01, missing=()):
+        self.delay = delay
+        self.missing = set(missing)
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, domain: str) -> DomainResolution:
+        self.calls.append(domain)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if domain in self.missing:
+            return DomainResolution(DNSOutcome.NXDOMAIN, ttl=60)
+        return DomainResolution(DNSOutcome.MX, (f"mx.{domain}",), 300)
+
+
+@pytest.fixture
+def validator():
+    return EmailValidator(Settings(batch_concurrency=4, disposable_domains=["tempmail.com"]))
+
+
+class TestBatchValidation:
+    """Test grouped batch validation"""
+
+    @pytest.mark.asyncio
+    async def test_each_domain_resolved_once(self, validator):
+        resolver = TrackingResolver()
+        validator._resolve_domain_async = resolver
+        emails = [f"user{i}@{d}" for i in range(30) for d in ("gmail.com", "yahoo.com", "corp.example")]
+        results = await validator.validate_batch_async(emails)
+        assert len(results) == 90
+        assert sorted(resolver.calls) == ["corp.example", "gmail.com", "yahoo.com"]
+
+    @pytest.mark.asyncio
+    async def test_order_preserved(self, validator):
+        validator._resolve_domain_async = TrackingResolver(missing={"gone.example"})
+        emails = ["a@gmail.com", "bad-address", "b@gone.example", "c@tempmail.com", "d@gmail.com"]
+        reasons = [r[1] for r in await validator.validate_batch_async(emails)]
+        assert reasons == [
+            ValidationReason.VALID,
+            ValidationReason.INVALID_SYNTAX,
+            ValidationReason.NO_MX_RECORD,
+            ValidationReason.DISPOSABLE,
+            ValidationReason.VALID,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self, validator):
+        resolver = TrackingResolver(delay=0.02)
+        validator._resolve_domain_async = resolver
+        await validator.validate_batch_async([f"u@d{i}.example" for i in range(20)])
+        assert len(resolver.calls) == 20
+        assert resolver.peak == 4
+
+    @pytest.mark.asyncio
+    async def test_matches_single_validation(self, validator):
+        validator._resolve_domain_async = TrackingResolver()
+        emails = ["John@Gmail.com", "admin@gmail.com", "x@tempmail.com"]
+        batch = await validator.validate_batch_async(emails)
+        single = [await validator.validate_email_async(e) for e in emails]
+        assert [(r[0], r[1], r[3]) for r in batch] == [(r[0], r[1], r[3]) for r in single]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, validator):
+        assert await validator.validate_batch_async([]) == []
+
+
+class TestBatchEndpoint:
+    """Test /v1/verify/batch"""
+
+    def test_counts_and_order(self):
+        app = create_app(Settings())
+        app.state.validator._resolve_domain_async = TrackingResolver(missing={"gone.example"})
+        client = TestClient(app)
+        emails = ["B@gmail.com", "c@gone.example", "a@gmail.com"]
+        body = client.post("/v1/verify/batch", json={"emails": emails}).json()
+        assert [r["email"] for r in body["results"]] == ["b@gmail.com", "c@gone.example", "a@gmail.com"]
+        assert (body["total"], body["valid"], body["invalid"]) == (3, 2, 1)
@@ -0,0 +1,164 @@
+"""
+Tests for streaming bulk verification and the CLI
+"""
+
+import asyncio
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import bulk
+from app.cli import verify_file
+from app.config import Settings
+from app.dns_cache import DNSOutcome, DomainResolution
+from app.main import create_app
+from app.validator import EmailValidator
+
+
+async def fake_resolve(domain: str) -> DomainResolution:
+    await asyncio.sleep(0)
+    if domain.startswith("gone."):
+        return DomainResolution(DNSOutcome.NXDOMAIN, ttl=60)
+    return DomainResolution(DNSOutcome.MX, (f"mx.{domain}",), 300)
+
+
+async def agen(items):
+    for item in items:
+        yield item
+
+
+async def collect(aiter):
+    return [item async for item in aiter]
+
+
+@pytest.fixture
+def validator():
+    validator = EmailValidator(Settings())
+    validator._resolve_domain_async = fake_resolve
+    return validator
+
+
+class TestReaders:
+    """Test incremental input parsing"""
+
+    @pytest.mark.asyncio
+    async def test_lines_split_across_chunks(self):
+        data = "a@x.com\r\nbé@x.com\nlast@x.com".encode("utf-8")
+        chunks = [data[i:i + 3] for i in range(0, len(data), 3)]
+        lines = await collect(bulk.iter_lines(agen(chunks)))
+        assert lines == ["a@x.com", "bé@x.com", "last@x.com"]
+
+    @pytest.mark.asyncio
+    async def test_csv_with_header(self):
+        lines = ["name,Email", 'Bob,bob@x.com', '"Doe, J",j@x.com', ""]
+        assert await collect(bulk.iter_addresses(agen(lines), "csv")) == ["bob@x.com", "j@x.com"]
+
+    @pytest.mark.asyncio
+    async def test_csv_without_header(self):
+        lines = ["a@x.com", "b@x.com,extra"]
+        assert await collect(bulk.iter_addresses(agen(lines), "csv")) == ["a@x.com", "b@x.com"]
+
+    @pytest.mark.asyncio
+    async def test_ndjson(self):
+        lines = ['"a@x.com"', '{"email": "b@x.com", "id": 2}', "not json", "{}"]
+        assert await collect(bulk.iter_addresses(agen(lines), "ndjson")) == ["a@x.com", "b@x.com"]
+
+
+class TestVerifyStream:
+    """Test pipelined chunk verification"""
+
+    @pytest.mark.asyncio
+    async def test_order_and_progress(self, validator):
+        emails = [f"u{i}@{'gone.' if i % 3 == 0 else ''}d{i % 7}.example" for i in range(25)]
+        progress = bulk.StreamProgress()
+        batches = await collect(bulk.verify_stream(validator, agen(emails), progress, chunk_size=4))
+        records = [r for batch in batches for r in batch]
+        assert [r["email"] for r in records] == emails
+        assert len(batches) == 7
+        assert progress.snapshot()["processed"] == 25
+        assert progress.invalid == 9
+        assert progress.valid == 16
+        assert progress.done
+
+    @pytest.mark.asyncio
+    async def test_input_not_read_ahead_of_consumer(self, validator):
+        async def endless():
+            i = 0
+            while True:
+                yield f"user{i}@gmail.com"
+                i += 1
+
+        progress = bulk.StreamProgress()
+        stream = bulk.verify_stream(validator, endless(), progress, chunk_size=10, pipeline_depth=2)
+        await stream.__anext__()
+        await asyncio.sleep(0.01)
+        assert progress.read <= 30
+        await stream.aclose()
+        assert progress.done
+
+    @pytest.mark.asyncio
+    async def test_csv_rendering(self, validator):
+        progress = bulk.StreamProgress()
+        batches = bulk.verify_stream(validator, agen(["a@x.com"]), progress)
+        text = "".join(await collect(bulk.render(batches, "csv")))
+        assert text.splitlines() == [
+            "email,valid,reason,score,suggestion,syntax,mx,disposable,role",
+            "a@x.com,true,valid,100,,true,true,false,false",
+        ]
+
+
+class TestStreamEndpoint:
+    """Test /v1/verify/stream"""
+
+    @pytest.fixture
+    def client(self):
+        app = create_app(Settings(stream_chunk_size=2))
+        app.state.validator._resolve_domain_async = fake_resolve
+        return TestClient(app)
+
+    def test_ndjson_in_ndjson_out(self, client):
+        body = "\n".join(json.dumps({"email": e}) for e in ["A@x.com", "b@gone.x.com", "c@x.com"])
+        response = client.post(
+            "/v1/verify/stream",
+            content=body.encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [(r["email"], r["valid"]) for r in records] == [
+            ("a@x.com", True), ("b@gone.x.com", False), ("c@x.com", True)
+        ]
+
+        progress = client.get(f"/v1/verify/stream/{response.headers['x-stream-id']}").json()
+        assert progress["processed"] == 3
+        assert progress["done"] is True
+
+    def test_csv_in_csv_out(self, client):
+        response = client.post(
+            "/v1/verify/stream?output=csv",
+            content=b"email\na@x.com\nbad\n",
+            headers={"Content-Type": "text/csv"},
+        )
+        rows = response.text.splitlines()
+        assert rows[0].startswith("email,valid")
+        assert rows[2].startswith("bad,false,invalid_syntax")
+
+    def test_unknown_stream(self, client):
+        assert client.get("/v1/verify/stream/nope").status_code == 404
+
+
+class TestCLI:
+    """Test the bulk verification CLI"""
+
+    @pytest.mark.asyncio
+    async def test_verify_file(self, monkeypatch):
+        monkeypatch.setattr(EmailValidator, "_resolve_domain_async", lambda self, d: fake_resolve(d))
+        source = io.BytesIO(b"email\nx@gmail.com\ny@gone.example\n")
+        sink = io.StringIO()
+        progress = await verify_file(source, sink, "csv", "ndjson", Settings())
+        records = [json.loads(line) for line in sink.getvalue().splitlines()]
+        assert [r["valid"] for r in records] == [True, False]
+        assert progress.processed == 2
@@ -0,0 +1,173 @@
+"""
+Tests for the TTL-aware DNS result cache
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import dns.message
+import dns.resolver
+import dns.rrset
+import pytest
+
+from app.config import Settings
+from app.dns_cache import DNSCache, DNSOutcome, DomainResolution, negative_ttl
+from app.validator import EmailValidator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return DNSCache(max_entries=3, min_ttl=10, max_ttl=100, negative_max_ttl=50, clock=clock)
+
+
+def _soa_response(soa_ttl: int, minimum: int):
+    query = dns.message.make_query("missing.example", "MX")
+    response = dns.message.make_response(query)
+    response.authority.append(dns.rrset.from_text(
+        "example.", soa_ttl, "IN", "SOA",
+        f"ns.example. admin.example. 1 1800 900 604800 {minimum}",
+    ))
+    return response
+
+
+class TestDNSCache:
+    """Test cache storage, expiry and eviction"""
+
+    def test_ttl_honored(self, cache, clock):
+        cache.put("a.com", DomainResolution(DNSOutcome.MX, ("mx.a.com",), 30))
+        clock.now += 29
+        assert cache.get("a.com").hosts == ("mx.a.com",)
+        clock.now += 2
+        assert cache.get("a.com") is None
+
+    def test_ttl_clamped(self, cache, clock):
+        cache.put("short.com", DomainResolution(DNSOutcome.MX, ttl=1))
+        cache.put("long.com", DomainResolution(DNSOutcome.MX, ttl=86400))
+        clock.now += 9
+        assert cache.get("short.com") is not None
+        clock.now += 92
+        assert cache.get("long.com") is None
+
+    def test_negative_ttl_clamped_separately(self, cache, clock):
+        cache.put("gone.com", DomainResolution(DNSOutcome.NXDOMAIN, ttl=86400))
+        clock.now += 51
+        assert cache.get("gone.com") is None
+
+    def test_lru_eviction(self, cache):
+        for name in ("a.com", "b.com", "c.com"):
+            cache.put(name, DomainResolution(DNSOutcome.MX, ttl=60))
+        cache.get("a.com")
+        cache.put("d.com", DomainResolution(DNSOutcome.MX, ttl=60))
+        assert cache.get("b.com") is None
+        assert cache.get("a.com") is not None
+        assert len(cache) == 3
+
+    def test_hit_ratio(self, cache):
+        resolve = MagicMock(return_value=DomainResolution(DNSOutcome.MX, ttl=60))
+        for _ in range(4):
+            cache.get_or_resolve("a.com", resolve)
+        assert resolve.call_count == 1
+        stats = cache.stats()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.75
+
+    def test_errors_not_cached(self, cache):
+        resolve = MagicMock(side_effect=dns.resolver.LifetimeTimeout(timeout=1.0, errors=[]))
+        for _ in range(2):
+            with pytest.raises(dns.exception.Timeout):
+                cache.get_or_resolve("slow.com", resolve)
+        assert resolve.call_count == 2
+
+    def test_concurrent_lookups_coalesced(self):
+        cache = DNSCache()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def resolve(domain):
+            calls.append(domain)
+            started.set()
+            release.wait(5)
+            return DomainResolution(DNSOutcome.MX, ("mx",), 60)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_resolve("a.com", resolve)))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for t in threads[1:]:
+            t.start()
+        while cache.stats()["coalesced"] < 4:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert calls == ["a.com"]
+        assert len(results) == 5
+        assert cache.stats()["coalesced"] == 4
+
+
+class TestNegativeTTL:
+    """Test RFC 2308 negative TTL derivation"""
+
+    def test_soa_minimum_used(self):
+        exc = dns.resolver.NoAnswer(response=_soa_response(900, 300))
+        assert negative_ttl(exc) == 300
+
+    def test_soa_ttl_used_when_lower(self):
+        exc = dns.resolver.NoAnswer(response=_soa_response(120, 300))
+        assert negative_ttl(exc) == 120
+
+    def test_nxdomain_responses(self):
+        response = _soa_response(600, 60)
+        qname = response.question[0].name
+        exc = dns.resolver.NXDOMAIN(qnames=[qname], responses={qname: response})
+        assert negative_ttl(exc) == 60
+
+    def test_no_soa(self):
+        query = dns.message.make_query("x.example", "MX")
+        exc = dns.resolver.NoAnswer(response=dns.message.make_response(query))
+        assert negative_ttl(exc) is None
+
+
+class TestValidatorCaching:
+    """Test validator resolves each domain once"""
+
+    def test_repeated_domain_resolved_once(self):
+        validator = EmailValidator(Settings())
+        resolve = MagicMock(return_value=DomainResolution(DNSOutcome.MX, ("mx.gmail.com",), 300))
+        validator._resolve_domain = resolve
+        for i in range(10):
+            valid, _, checks, _, _ = validator.validate_email(f"user{i}@gmail.com")
+            assert valid and checks.mx
+        assert resolve.call_count == 1
+
+    def test_nxdomain_cached_as_invalid(self):
+        validator = EmailValidator(Settings())
+        validator._resolve_domain = MagicMock(return_value=DomainResolution(DNSOutcome.NXDOMAIN, ttl=60))
+        assert validator._validate_mx("nope.example") == (False, 0)
+        assert validator._validate_mx("nope.example") == (False, 0)
+        assert validator._resolve_domain.call_count == 1
+
+    def test_a_fallback_score(self):
+        validator = EmailValidator(Settings())
+        validator._resolve_domain = MagicMock(return_value=DomainResolution(DNSOutcome.A, ("1.2.3.4",), 60))
+        assert validator._validate_mx("a-only.example") == (True, 50)
@@ -0,0 +1,88 @@
+"""
+Tests for precompiled domain indexes and the app-scoped validator
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.domain_index import DomainIndex
+from app.main import create_app
+from app.validator import EmailValidator
+
+
+class TestDomainIndex:
+    """Test suffix-matching domain index"""
+
+    def test_exact_match(self):
+        index = DomainIndex(["mailinator.com", "tempmail.com"])
+        assert "mailinator.com" in index
+        assert "gmail.com" not in index
+
+    def test_subdomain_match(self):
+        index = DomainIndex(["mailinator.com"])
+        assert index.match("mx.mailinator.com") == "mailinator.com"
+        assert "a.b.mailinator.com" in index
+
+    def test_no_partial_label_match(self):
+        """notmailinator.com must not match mailinator.com"""
+        index = DomainIndex(["mailinator.com"])
+        assert "notmailinator.com" not in index
+
+    def test_tld_is_never_matched_alone(self):
+        index = DomainIndex(["com"])
+        assert "gmail.com" not in index
+
+    def test_entries_normalized(self):
+        index = DomainIndex(["  TempMail.COM. ", ""])
+        assert len(index) == 1
+        assert "tempmail.com" in index
+
+    def test_from_file(self, tmp_path):
+        path = tmp_path / "disposable.txt"
+        path.write_text("# header\nfoo.io\n\nbar.net  # trailing comment\n")
+        index = DomainIndex.from_file(path, extra=["baz.org"])
+        assert list(index) == ["bar.net", "baz.org", "foo.io"]
+
+    def test_large_index_lookup(self):
+        index = DomainIndex(f"disposable{i}.example" for i in range(200_000))
+        assert len(index) == 200_000
+        assert "x.disposable199999.example" in index
+        assert "disposable200000.example" not in index
+
+
+class TestValidatorIndexes:
+    """Test validator wiring of compiled indexes"""
+
+    def test_disposable_file_merged(self, tmp_path):
+        path = tmp_path / "disposable.txt"
+        path.write_text("filedomain.io\n")
+        validator = EmailValidator(Settings(
+            disposable_domains=["tempmail.com"],
+            disposable_domains_file=str(path),
+        ))
+        assert validator._is_disposable("filedomain.io")
+        assert validator._is_disposable("sub.tempmail.com")
+        assert not validator._is_disposable("gmail.com")
+
+
+class TestAppScopedValidator:
+    """Test the validator is built once per app"""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(create_app(Settings(disposable_domains=["tempmail.com"])))
+
+    def test_validator_shared_across_requests(self, client):
+        validator = client.app.state.validator
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(validator, "_validate_mx_async", AsyncMock(return_value=(True, 60)))
+            assert client.post("/v1/verify", json={"email": "a@gmail.com"}).status_code == 200
+            assert client.post("/v1/verify", json={"email": "b@gmail.com"}).status_code == 200
+        assert client.app.state.validator is validator
+
+    def test_disposable_listing_uses_index(self, client):
+        response = client.get("/v1/disposable-domains")
+        assert response.json() == {"domains": ["tempmail.com"], "count": 1}
@@ -0,0 +1,107 @@
+"""
+Tests for the domain typo suggestion engine
+"""
+
+import time
+
+import pytest
+
+from app.config import Settings
+from app.suggest import DEFAULT_POPULAR_DOMAINS, TypoSuggester, keyboard_distance
+from app.validator import EmailValidator
+
+
+@pytest.fixture(scope="module")
+def suggester():
+    return TypoSuggester(DEFAULT_POPULAR_DOMAINS)
+
+
+class TestKeyboardDistance:
+    """Test keyboard-aware edit distance"""
+
+    def test_identical(self):
+        assert keyboard_distance("gmail.com", "gmail.com") == 0
+
+    def test_adjacent_key_cheaper(self):
+        # 'n' is next to 'm'; 'p' is not
+        assert keyboard_distance("gnail.com", "gmail.com") < keyboard_distance("gpail.com", "gmail.com")
+
+    def test_transposition(self):
+        assert keyboard_distance("gmial.com", "gmail.com") < 1
+
+    def test_doubled_key(self):
+        assert keyboard_distance("gmaill.com", "gmail.com") == 0.5
+
+
+class TestTypoSuggester:
+    """Test suggestions"""
+
+    @pytest.mark.parametrize("typo,expected", [
+        ("gmial.com", "gmail.com"),
+        ("gmail.co", "gmail.com"),
+        ("gmail.cmo", "gmail.com"),
+        ("gnail.com", "gmail.com"),
+        ("yaho.com", "yahoo.com"),
+        ("hotmial.com", "hotmail.com"),
+        ("outlok.com", "outlook.com"),
+        ("gmx.con", "gmx.com"),
+    ])
+    def test_common_typos(self, suggester, typo, expected):
+        assert suggester.suggest(typo) == expected
+
+    def test_known_domain_not_corrected(self, suggester):
+        assert suggester.suggest("gmail.com") is None
+        assert suggester.suggest("yahoo.co.uk") is None
+
+    def test_unrelated_domain(self, suggester):
+        assert suggester.suggest("example.com") is None
+        assert suggester.suggest("mycompany.io") is None
+
+    def test_popularity_breaks_ties(self):
+        suggester = TypoSuggester({"abcde.com": 1, "abcdf.com": 1000})
+        # 'abcdx.com' is one non-adjacent substitution from both
+        assert suggester.suggest("abcdx.com") == "abcdf.com"
+
+    def test_from_file(self, tmp_path):
+        path = tmp_path / "popular.txt"
+        path.write_text("# domain weight\nexample-mail.com 10\nother.org\n")
+        suggester = TypoSuggester.from_file(path)
+        assert len(suggester) == 2
+        assert suggester.suggest("exmaple-mail.com") == "example-mail.com"
+
+    def test_snapshot_roundtrip(self, tmp_path, suggester):
+        path = tmp_path / "typo.idx"
+        suggester.save(path)
+        loaded = TypoSuggester.load(path)
+        assert loaded.suggest("gmial.com") == "gmail.com"
+        assert len(loaded) == len(suggester)
+
+    def test_lookup_fast_with_50k_domains(self):
+        domains = dict(DEFAULT_POPULAR_DOMAINS)
+        domains.update((f"mailhost{i}.example", 1) for i in range(50_000))
+        suggester = TypoSuggester(domains)
+        probes = ["gmial.com", "mailhost1234.exmaple", "unknown-domain.org", "yaho.com"]
+        started = time.perf_counter()
+        for _ in range(100):
+            for probe in probes:
+                suggester.suggest(probe)
+        per_lookup = (time.perf_counter() - started) / 400
+        assert suggester.suggest("gmial.com") == "gmail.com"
+        assert per_lookup < 0.005
+
+
+class TestValidatorSuggestions:
+    """Test suggestion wiring in the validator"""
+
+    def test_suggestion_keeps_local_part(self):
+        validator = EmailValidator(Settings())
+        validator._validate_mx = lambda domain: (True, 60)
+        *_, suggestion = validator.validate_email("gmail.co@gmial.com")
+        assert suggestion == "gmail.co@gmail.com"
+
+    def test_snapshot_written_and_reused(self, tmp_path):
+        snapshot = tmp_path / "typo.idx"
+        EmailValidator(Settings(typo_snapshot_file=str(snapshot)))
+        assert snapshot.exists()
+        validator = EmailValidator(Settings(typo_snapshot_file=str(snapshot)))
+        assert validator.suggester.suggest("hotmal.com") == "hotmail.com"